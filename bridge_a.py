@@ -3,27 +3,107 @@
 Bridge A - Простой мост между пультом и UDP или UART монитор
 Подключается к пульту по UART и пересылает данные в UDP,
 либо просто отображает данные с UART, если UDP не настроен.
+
+Рекомендуется запуск на free-threaded сборке CPython 3.13+ (python3.13t):
+потоки чтения UART и приема UDP тогда работают параллельно на разных ядрах.
+Общее состояние к этому готово - у каждого счетчика один поток-писатель,
+пачка UART -> UDP защищена блокировкой.
 """
 
 import time
 import threading
 import argparse
+import logging
+import os
+import selectors
+import sys
+import sysconfig
 import serial
 from udp_transport import BidirectionalUDPTransport
+from io_tuning import DEFAULT_UDP_SOCKET_BUFFER, configure_udp_buffers, enable_low_latency
 from typing import Optional
 
+# numpy необязателен: загружается только при инверсии UART (_load_numpy)
+np = None
+
+_LOG = logging.getLogger("bridge_a")
+
+# Окно накопления UART данных перед отправкой одной UDP датаграммой (сек)
+UDP_BATCH_WINDOW = 0.002
+# Максимальный размер пачки: 1500 (MTU) - 20 (IP) - 8 (UDP) - 11 (заголовок транспорта)
+UDP_BATCH_MAX_BYTES = 1461
+
+# Период вывода статистики (сек)
+STATS_INTERVAL = 30.0
+
+# Не чаще одной строки лога за этот период в режиме монитора (сек): вывод в
+# консоль на каждое чтение тормозит поток чтения UART
+MONITOR_LOG_INTERVAL = 0.1
+
+# Приоритет SCHED_FIFO потока чтения UART (0 - обычный планировщик)
+UART_RT_PRIORITY = 10
+
+# Ожидание данных UART (сек) - ограничивает время реакции на остановку
+UART_SELECT_TIMEOUT = 0.5
+# Максимальный объем одного чтения из UART
+UART_READ_SIZE = 4096
+
+# Таблица инверсии байтов для bytes.translate
+_INV_TABLE = bytes(b ^ 0xFF for b in range(256))
+# Начиная с этого размера инверсия выполняется через numpy (векторный XOR). Вызов
+# numpy стоит ~1.7 мкс независимо от размера, translate обгоняет его примерно до 2 КБ,
+# поэтому numpy достаются только крупные чтения после задержек потока, а не фреймы CRSF
+NUMPY_INVERT_MIN_BYTES = 2048
+
+def _load_numpy():
+    """Загрузка numpy для инверсии крупных чтений, если он установлен"""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return
+        np = numpy
+
+def _invert_bytes(data) -> bytes:
+    """Инверсия байтов (XOR 0xFF), принимает bytes или memoryview"""
+    if np is not None and len(data) >= NUMPY_INVERT_MIN_BYTES:
+        return np.bitwise_xor(np.frombuffer(data, dtype=np.uint8), 0xFF).tobytes()
+    return bytes(data).translate(_INV_TABLE)
+
+def _hex_preview(data, limit: int = 16) -> str:
+    """HEX представление первых limit байт (форматирование на стороне C)"""
+    preview = data[:limit].hex(' ').upper()
+    return preview + '...' if len(data) > limit else preview
+
 class SimpleBridge:
     """Простой мост или UART монитор"""
     
     def __init__(self, uart_port: str, uart_baudrate: int,
                  udp_local_port: Optional[int] = None, udp_remote_host: Optional[str] = None, udp_remote_port: Optional[int] = None,
-                 invert_uart: bool = False):
+                 invert_uart: bool = False,
+                 udp_rcvbuf: int = DEFAULT_UDP_SOCKET_BUFFER, udp_sndbuf: int = DEFAULT_UDP_SOCKET_BUFFER,
+                 udp_batch: bool = True, debug_uart: bool = False,
+                 uart_rt_priority: int = UART_RT_PRIORITY, uart_cpu: Optional[int] = None):
         self.uart_port = uart_port
         self.uart_baudrate = uart_baudrate
         self.uart = None
         self.is_running = False
         self.uart_thread = None
         self.invert_uart = invert_uart
+        self.udp_rcvbuf = udp_rcvbuf
+        self.udp_sndbuf = udp_sndbuf
+        self.uart_rt_priority = uart_rt_priority
+        self.uart_cpu = uart_cpu
+
+        # Накопление UART -> UDP: пачку отправляет один постоянный поток по
+        # истечении окна (срок хранится в _tx_deadline), а не таймер на каждую пачку
+        self.udp_batch = udp_batch
+        self._tx_chunks = []
+        self._tx_len = 0
+        self._tx_cond = threading.Condition()
+        self._tx_deadline = None
+        self._tx_thread = None
 
         self.udp_transport = None
         if udp_local_port and udp_remote_host and udp_remote_port:
@@ -31,30 +111,49 @@ class SimpleBridge:
                 udp_local_port, udp_remote_host, udp_remote_port
             )
         
-        self.stats = {
-            'uart_to_udp_packets': 0,
-            'udp_to_uart_packets': 0,
-            'uart_to_udp_bytes': 0,
-            'udp_to_uart_bytes': 0,
-            'start_time': time.time(),
-            'last_uart_rx': 0,
-            'last_udp_rx': 0
-        }
+        # Счетчики статистики - обычные атрибуты вместо словаря (горячий путь).
+        # У каждого счетчика один писатель: uart_* меняет только поток чтения UART,
+        # udp_* - только поток UDP, поэтому блокировки не нужны, а get_stats()
+        # читает их без синхронизации.
+        self._uart_to_udp_packets = 0
+        self._udp_to_uart_packets = 0
+        self._uart_to_udp_bytes = 0
+        self._udp_to_uart_bytes = 0
+        self._start_time = time.time()
+        # Отметки времени в нс по монотонным часам (не зависят от NTP); наружу
+        # (get_stats) отдаются в шкале time.time(), как и start_time
+        self._start_ns = time.monotonic_ns()
+        self._last_uart_rx_ns = 0
+        self._last_udp_rx_ns = 0
         
-        self.stats_thread = None
-        self.debug_uart_mode = False
+        # Переиспользуемый буфер приема UART
+        self._rx_buf = bytearray(UART_READ_SIZE)
+        self._rx_mv = memoryview(self._rx_buf)
+
+        self._stats_timer = None
+        # Ограничение частоты лога монитора
+        self._monitor_next_log_ns = 0
+        self._monitor_skipped = 0
+        self._monitor_last = b''
+        self._monitor_last_len = 0
+        self.debug_uart_mode = debug_uart
+        # Обработчик UART выбирается в start() по текущим debug_uart_mode/invert_uart
+        self._debug_label = "UART RX"
+        self._on_uart_data = None
         
     def start(self):
         """Запуск моста/монитора"""
-        print("Запуск Simple Bridge (Bridge A)...")
+        _LOG.info("Запуск Simple Bridge (Bridge A)...")
 
         try:
             self.uart = serial.Serial(self.uart_port, self.uart_baudrate, timeout=1)
-            print(f"UART порт {self.uart.port} открыт")
+            _LOG.info("UART порт %s открыт", self.uart.port)
+            enable_low_latency(self.uart)
         except serial.SerialException as e:
-            print(f"Не удалось открыть UART порт {self.uart_port}: {e}")
+            _LOG.error("Не удалось открыть UART порт %s: %s", self.uart_port, e)
             raise
         
+        self._on_uart_data = self._make_uart_handler()
         self.is_running = True
         self.uart_thread = threading.Thread(target=self._uart_reader_loop, daemon=True)
         self.uart_thread.start()
@@ -62,34 +161,46 @@ class SimpleBridge:
         if self.udp_transport:
             self.udp_transport.set_data_callback(self._on_udp_data)
             self.udp_transport.start()
+            configure_udp_buffers(self.udp_transport, self.udp_rcvbuf, self.udp_sndbuf)
+            if self.udp_batch:
+                self._tx_thread = threading.Thread(target=self._tx_flush_loop, daemon=True)
+                self._tx_thread.start()
         
-        self.stats_thread = threading.Thread(target=self._stats_loop, daemon=True)
-        self.stats_thread.start()
+        self._schedule_stats()
         
-        print("Simple Bridge запущен")
-        print(f"UART: {self.uart.port} @ {self.uart.baudrate}")
+        _LOG.info("Simple Bridge запущен")
+        _LOG.info("UART: %s @ %d", self.uart.port, self.uart.baudrate)
         if self.udp_transport:
-            print(f"UDP: {self.udp_transport.transport.local_port} -> {self.udp_transport.transport.remote_host}:{self.udp_transport.transport.remote_port}")
+            transport = self.udp_transport.transport
+            _LOG.info("UDP: %s -> %s:%s", transport.local_port, transport.remote_host, transport.remote_port)
         elif self.debug_uart_mode:
-            print("--- РЕЖИМ ОТЛАДКИ UART АКТИВЕН ---")
+            _LOG.info("--- РЕЖИМ ОТЛАДКИ UART АКТИВЕН ---")
         else:
-            print("UDP транспорт отключен. Работа в режиме монитора UART.")
+            _LOG.info("UDP транспорт отключен. Работа в режиме монитора UART.")
         
     def stop(self):
         """Остановка моста/монитора"""
-        print("Остановка Simple Bridge...")
+        _LOG.info("Остановка Simple Bridge...")
         self.is_running = False
+        if self._stats_timer:
+            self._stats_timer.cancel()
         if self.uart_thread:
             self.uart_thread.join()
         
+        if self._tx_thread:
+            with self._tx_cond:
+                self._tx_cond.notify()
+            self._tx_thread.join()
+        
         if self.udp_transport:
+            self._flush_tx()
             self.udp_transport.stop()
 
         if self.uart and self.uart.is_open:
             self.uart.close()
-            print("UART порт закрыт")
+            _LOG.info("UART порт закрыт")
             
-        print("Simple Bridge остановлен")
+        _LOG.info("Simple Bridge остановлен")
 
     def __enter__(self):
         self.start()
@@ -98,18 +209,55 @@ class SimpleBridge:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
         
+    def _setup_reader_scheduling(self):
+        """Привязка потока чтения UART к ядру и SCHED_FIFO (вызывается из самого потока)"""
+        if self.uart_cpu is not None:
+            try:
+                os.sched_setaffinity(0, {self.uart_cpu})
+            except (AttributeError, OSError) as e:
+                _LOG.warning("Не удалось привязать поток UART к CPU %d: %s", self.uart_cpu, e)
+        if self.uart_rt_priority > 0:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.uart_rt_priority))
+            except PermissionError:
+                _LOG.warning("Нет прав на SCHED_FIFO для потока UART (нужен CAP_SYS_NICE), используется обычный планировщик")
+            except (AttributeError, OSError) as e:
+                _LOG.warning("Не удалось установить SCHED_FIFO для потока UART: %s", e)
+
     def _uart_reader_loop(self):
         """Цикл чтения из UART"""
-        while self.is_running:
-            try:
-                if self.uart and self.uart.is_open and self.uart.in_waiting > 0:
-                    data = self.uart.read(self.uart.in_waiting)
-                    self._on_uart_data(data)
-            except serial.SerialException as e:
-                print(f"Ошибка чтения из UART: {e}")
-                self.is_running = False
-                break
-            time.sleep(0.001)
+        self._setup_reader_scheduling()
+        # Ждем данные в epoll и читаем напрямую из fd, минуя Python-обертку pyserial
+        fd = self.uart.fileno()
+        rx_buf = [self._rx_buf]
+        rx_mv = self._rx_mv
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            while self.is_running:
+                try:
+                    # Пока в мониторе есть невыведенные чтения, ждем не дольше
+                    # MONITOR_LOG_INTERVAL и при тишине на линии выводим сводку
+                    if not sel.select(MONITOR_LOG_INTERVAL if self._monitor_skipped else UART_SELECT_TIMEOUT):
+                        if self._monitor_skipped:
+                            self._flush_monitor_log()
+                        continue
+                    n = os.readv(fd, rx_buf)
+                    if not n:
+                        # fd готов к чтению, но данных нет - EOF (адаптер отключен),
+                        # иначе поток крутился бы в цикле на 100% CPU
+                        _LOG.error("UART порт %s отключен: устройство готово к чтению, но данных нет",
+                                   self.uart_port)
+                        self.is_running = False
+                        break
+                    self._on_uart_data(rx_mv[:n])
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    _LOG.error("Ошибка чтения из UART: %s", e)
+                    self.is_running = False
+                    break
+        if self._monitor_skipped:
+            self._flush_monitor_log()
 
     def send_to_uart(self, data: bytes) -> bool:
         """Отправка данных в UART"""
@@ -118,71 +266,211 @@ class SimpleBridge:
                 self.uart.write(data)
                 return True
             except serial.SerialException as e:
-                print(f"Ошибка записи в UART: {e}")
+                _LOG.error("Ошибка записи в UART: %s", e)
         return False
         
-    def _on_uart_data(self, data: bytes):
-        """Обработчик данных от UART - пересылаем в UDP или выводим на экран"""
-        if len(data) > 0:
-            
-            if self.invert_uart:
-                data = bytes(b ^ 0xFF for b in data)
+    def _make_uart_handler(self):
+        """Выбор обработчика UART данных под режим работы.
+
+        Вызывается из start(): режим фиксирован на время работы моста, поэтому
+        ветвления по режиму разрешаются один раз здесь, а не на каждом пакете, и
+        учитывают атрибуты, измененные после создания моста. Обработчик получает
+        memoryview переиспользуемого буфера приема, действительный только до
+        возврата из обработчика.
+        """
+        if self.debug_uart_mode:
+            handler = self._handle_uart_debug
+        elif self.udp_transport is None:
+            handler = self._handle_uart_monitor
+        elif self.udp_batch:
+            handler = self._handle_uart_udp_batch
+        else:
+            handler = self._handle_uart_udp
+
+        self._debug_label = "UART RX (INVERTED)" if self.invert_uart else "UART RX"
+        if self.invert_uart:
+            _load_numpy()
+            def handle_inverted(data, _handler=handler):
+                _handler(_invert_bytes(data))
+            return handle_inverted
+        return handler
+
+    def _handle_uart_debug(self, data):
+        """Режим отладки UART - выводим все байты"""
+        self._last_uart_rx_ns = time.monotonic_ns()
+        self._uart_to_udp_packets += 1
+        self._uart_to_udp_bytes += len(data)
+        _LOG.info("%s: %d bytes: %s", self._debug_label, len(data), data.hex(' ').upper())
+
+    def _handle_uart_monitor(self, data):
+        """Режим монитора UART - выводим начало пакета, не чаще MONITOR_LOG_INTERVAL"""
+        now_ns = time.monotonic_ns()
+        self._last_uart_rx_ns = now_ns
+        self._uart_to_udp_packets += 1
+        self._uart_to_udp_bytes += len(data)
+        if now_ns < self._monitor_next_log_ns:
+            self._monitor_skipped += 1
+            # Начало последнего пропущенного чтения - для сводки при тишине на линии
+            self._monitor_last = bytes(data[:17])
+            self._monitor_last_len = len(data)
+            return
+        self._monitor_next_log_ns = now_ns + int(MONITOR_LOG_INTERVAL * 1e9)
+        if self._monitor_skipped:
+            _LOG.info("UART RX: %d bytes: %s (+%d чтений пропущено)",
+                      len(data), _hex_preview(data), self._monitor_skipped)
+            self._monitor_skipped = 0
+        else:
+            _LOG.info("UART RX: %d bytes: %s", len(data), _hex_preview(data))
+
+    def _flush_monitor_log(self):
+        """Вывод сводки по пропущенным чтениям монитора (вызывается потоком чтения)"""
+        _LOG.info("UART RX: %d bytes: %s (последнее из %d пропущенных чтений)",
+                  self._monitor_last_len, _hex_preview(self._monitor_last), self._monitor_skipped)
+        self._monitor_skipped = 0
+        # Следующее чтение выводится сразу
+        self._monitor_next_log_ns = 0
+
+    def _handle_uart_udp_batch(self, data):
+        """Режим моста - накапливаем данные и отправляем пачкой в UDP"""
+        self._last_uart_rx_ns = time.monotonic_ns()
+        self._uart_to_udp_packets += 1
+        self._uart_to_udp_bytes += len(data)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("UART->UDP: %d bytes: %s", len(data), _hex_preview(data))
+        self._queue_tx(data)
+
+    def _handle_uart_udp(self, data):
+        """Режим моста без накопления - каждое чтение отдельной датаграммой"""
+        self._last_uart_rx_ns = time.monotonic_ns()
+        self._uart_to_udp_packets += 1
+        self._uart_to_udp_bytes += len(data)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("UART->UDP: %d bytes: %s", len(data), _hex_preview(data))
+        # Длинное чтение (после задержки потока) делится на датаграммы не больше MTU
+        for offset in range(0, len(data), UDP_BATCH_MAX_BYTES):
+            self.udp_transport.send_crsf_data(bytes(data[offset:offset + UDP_BATCH_MAX_BYTES]))
+
+    def _queue_tx(self, data):
+        """Добавление данных в пачку UART -> UDP (чтение длиннее MTU делится на части)"""
+        with self._tx_cond:
+            for offset in range(0, len(data), UDP_BATCH_MAX_BYTES):
+                # Копия нужна: пачка хранит данные дольше, чем живет буфер приема
+                chunk = bytes(data[offset:offset + UDP_BATCH_MAX_BYTES])
+                if self._tx_len + len(chunk) > UDP_BATCH_MAX_BYTES:
+                    self._send_tx_locked()
+                # Храним ссылки на чанки, склейка выполняется один раз при отправке
+                self._tx_chunks.append(chunk)
+                self._tx_len += len(chunk)
+                if self._tx_len >= UDP_BATCH_MAX_BYTES:
+                    self._send_tx_locked()
+            if self._tx_chunks and self._tx_deadline is None:
+                self._tx_deadline = time.monotonic() + UDP_BATCH_WINDOW
+                self._tx_cond.notify()
+
+    def _tx_flush_loop(self):
+        """Поток отправки пачек по истечении окна накопления"""
+        with self._tx_cond:
+            while self.is_running:
+                if self._tx_deadline is None:
+                    self._tx_cond.wait()
+                    continue
+                remaining = self._tx_deadline - time.monotonic()
+                if remaining > 0:
+                    self._tx_cond.wait(remaining)
+                    continue
+                self._send_tx_locked()
+
+    def _flush_tx(self):
+        """Отправка накопленной пачки (при остановке)"""
+        with self._tx_cond:
+            self._send_tx_locked()
+
+    def _send_tx_locked(self):
+        """Отправка пачки, вызывается под _tx_cond"""
+        self._tx_deadline = None
+        if self._tx_chunks:
+            chunks = self._tx_chunks
+            data = chunks[0] if len(chunks) == 1 else b''.join(chunks)
+            self._tx_chunks = []
+            self._tx_len = 0
+            self.udp_transport.send_crsf_data(data)
 
-            self.stats['last_uart_rx'] = time.time()
-            self.stats['uart_to_udp_packets'] += 1
-            self.stats['uart_to_udp_bytes'] += len(data)
-            
-            if self.debug_uart_mode:
-                label = "UART RX (INVERTED)" if self.invert_uart else "UART RX"
-                print(f"{label}: {len(data)} bytes: {' '.join(f'{b:02X}' for b in data)}")
-                return
-
-            if self.udp_transport:
-                print(f"UART->UDP: {len(data)} bytes: {' '.join(f'{b:02X}' for b in data[:16])}{'...' if len(data) > 16 else ''}")
-                self.udp_transport.send_crsf_data(data)
-            else:
-                print(f"UART RX: {len(data)} bytes: {' '.join(f'{b:02X}' for b in data[:16])}{'...' if len(data) > 16 else ''}")
-                
     def _on_udp_data(self, data: bytes):
         """Обработчик данных от UDP - пересылаем в UART"""
         if len(data) > 0:
             success = self.send_to_uart(data)
             if success:
-                self.stats['udp_to_uart_packets'] += 1
-                self.stats['udp_to_uart_bytes'] += len(data)
-                self.stats['last_udp_rx'] = time.time()
+                self._udp_to_uart_packets += 1
+                self._udp_to_uart_bytes += len(data)
+                self._last_udp_rx_ns = time.monotonic_ns()
                 
-                print(f"UDP->UART: {len(data)} bytes: {' '.join(f'{b:02X}' for b in data[:16])}{'...' if len(data) > 16 else ''}")
+                if _LOG.isEnabledFor(logging.DEBUG):
+                    _LOG.debug("UDP->UART: %d bytes: %s", len(data), _hex_preview(data))
                 
-    def _stats_loop(self):
-        """Цикл вывода статистики"""
-        while self.is_running:
-            time.sleep(30)
-            self._print_stats()
+    def _to_wall_time(self, mono_ns: int) -> float:
+        """Перевод отметки time.monotonic_ns() во время time.time() (0 - событий не было)"""
+        return self._start_time + (mono_ns - self._start_ns) * 1e-9 if mono_ns else 0
+
+    def get_stats(self) -> dict:
+        """Возвращает статистику моста (отметки времени - по time.time())"""
+        return {
+            'uart_to_udp_packets': self._uart_to_udp_packets,
+            'udp_to_uart_packets': self._udp_to_uart_packets,
+            'uart_to_udp_bytes': self._uart_to_udp_bytes,
+            'udp_to_uart_bytes': self._udp_to_uart_bytes,
+            'start_time': self._start_time,
+            'last_uart_rx': self._to_wall_time(self._last_uart_rx_ns),
+            'last_udp_rx': self._to_wall_time(self._last_udp_rx_ns)
+        }
+
+    def _schedule_stats(self):
+        """Планирование следующего вывода статистики"""
+        self._stats_timer = threading.Timer(STATS_INTERVAL, self._print_and_reschedule)
+        self._stats_timer.daemon = True
+        self._stats_timer.start()
+
+    def _print_and_reschedule(self):
+        """Вывод статистики и повторное планирование, пока мост работает"""
+        self._print_stats()
+        if self.is_running:
+            self._schedule_stats()
             
     def _print_stats(self):
         """Вывод статистики"""
-        uptime = time.time() - self.stats['start_time']
-        uart_rx_ago = time.time() - self.stats['last_uart_rx'] if self.stats['last_uart_rx'] > 0 else uptime
+        stats = self.get_stats()
+        now_ns = time.monotonic_ns()
+        uptime = (now_ns - self._start_ns) * 1e-9
+        uart_rx_ago = (now_ns - self._last_uart_rx_ns) * 1e-9 if self._last_uart_rx_ns else uptime
         
-        print("\n" + "="*60)
-        print("SIMPLE BRIDGE СТАТИСТИКА")
-        print("="*60)
-        print(f"Время работы: {uptime:.1f} сек")
+        # Весь отчет - одна запись лога, чтобы не перемешивался с другими сообщениями
+        lines = ["", "="*60]
+        lines.append("SIMPLE BRIDGE СТАТИСТИКА")
+        lines.append("="*60)
+        lines.append(f"Время работы: {uptime:.1f} сек")
         
         if self.udp_transport:
-            udp_rx_ago = time.time() - self.stats['last_udp_rx'] if self.stats['last_udp_rx'] > 0 else uptime
+            udp_rx_ago = (now_ns - self._last_udp_rx_ns) * 1e-9 if self._last_udp_rx_ns else uptime
             udp_stats = self.udp_transport.get_stats()
-            print(f"UART -> UDP: {self.stats['uart_to_udp_packets']} пакетов, {self.stats['uart_to_udp_bytes']} байт")
-            print(f"UDP -> UART: {self.stats['udp_to_uart_packets']} пакетов, {self.stats['udp_to_uart_bytes']} байт")
-            print(f"Последний прием UART: {uart_rx_ago:.1f} сек назад")
-            print(f"Последний прием UDP: {udp_rx_ago:.1f} сек назад")
-            print(f"UDP соединение: {'активно' if udp_stats['connection_active'] else 'неактивно'}")
+            lines.append(f"UART -> UDP: {stats['uart_to_udp_packets']} пакетов, {stats['uart_to_udp_bytes']} байт")
+            lines.append(f"UDP -> UART: {stats['udp_to_uart_packets']} пакетов, {stats['udp_to_uart_bytes']} байт")
+            lines.append(f"Последний прием UART: {uart_rx_ago:.1f} сек назад")
+            lines.append(f"Последний прием UDP: {udp_rx_ago:.1f} сек назад")
+            lines.append(f"UDP соединение: {'активно' if udp_stats['connection_active'] else 'неактивно'}")
         else:
-            print(f"UART получено: {self.stats['uart_to_udp_packets']} пакетов, {self.stats['uart_to_udp_bytes']} байт")
-            print(f"Последний прием UART: {uart_rx_ago:.1f} сек назад")
+            lines.append(f"UART получено: {stats['uart_to_udp_packets']} пакетов, {stats['uart_to_udp_bytes']} байт")
+            lines.append(f"Последний прием UART: {uart_rx_ago:.1f} сек назад")
             
-        print("="*60)
+        lines.append("="*60)
+        _LOG.info("\n".join(lines))
+
+def _check_gil():
+    """Сообщает, работают ли потоки моста параллельно (free-threaded CPython)"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    if is_gil_enabled is None or is_gil_enabled():
+        if sysconfig.get_config_var('Py_GIL_DISABLED'):
+            _LOG.warning("GIL включен на free-threaded сборке Python (PYTHON_GIL=1 или несовместимое расширение)")
+        else:
+            _LOG.info("Python с GIL: потоки UART и UDP выполняются поочередно, для параллельной работы используйте python3.13t")
 
 def main():
     """Основная функция"""
@@ -190,14 +478,24 @@ def main():
     
     parser.add_argument('--uart-port', default='/dev/serial0', help='UART порт (по умолчанию: /dev/serial0)')
     parser.add_argument('--uart-baudrate', type=int, default=416666, help='UART baudrate (по умолчанию: 416666)')
+    parser.add_argument('--uart-rt-priority', type=int, default=UART_RT_PRIORITY, help=f'Приоритет SCHED_FIFO потока чтения UART, 0 - отключить (по умолчанию: {UART_RT_PRIORITY})')
+    parser.add_argument('--uart-cpu', type=int, default=None, help='Номер ядра CPU для потока чтения UART (по умолчанию: без привязки)')
     parser.add_argument('--debug-uart', action='store_true', help='Активировать режим отладки UART (только чтение и вывод)')
     parser.add_argument('--invert-uart', action='store_true', help='Инвертировать входящие UART данные (программно)')
     parser.add_argument('--udp-local-port', type=int, default=None, help='Локальный UDP порт (для активации моста)')
     parser.add_argument('--udp-remote-host', type=str, default=None, help='IP адрес удаленного моста (для активации моста)')
     parser.add_argument('--udp-remote-port', type=int, default=None, help='UDP порт удаленного моста (для активации моста)')
+    parser.add_argument('--verbose', action='store_true', help='Подробный лог каждого пакета (уровень DEBUG)')
+    parser.add_argument('--no-udp-batch', action='store_true', help='Отправлять каждое чтение UART отдельной датаграммой (без накопления 2 мс)')
+    parser.add_argument('--udp-rcvbuf', type=int, default=DEFAULT_UDP_SOCKET_BUFFER, help='Размер SO_RCVBUF UDP сокета в байтах (по умолчанию: 4 МБ)')
+    parser.add_argument('--udp-sndbuf', type=int, default=DEFAULT_UDP_SOCKET_BUFFER, help='Размер SO_SNDBUF UDP сокета в байтах (по умолчанию: 4 МБ)')
     
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+    _check_gil()
+
     # Проверка, что если указан один UDP параметр, то указаны все
     udp_params = [args.udp_local_port, args.udp_remote_host, args.udp_remote_port]
     if any(udp_params) and not all(udp_params):
@@ -213,25 +511,30 @@ def main():
             udp_local_port=args.udp_local_port,
             udp_remote_host=args.udp_remote_host,
             udp_remote_port=args.udp_remote_port,
-            invert_uart=args.invert_uart
+            invert_uart=args.invert_uart,
+            udp_rcvbuf=args.udp_rcvbuf,
+            udp_sndbuf=args.udp_sndbuf,
+            udp_batch=not args.no_udp_batch,
+            debug_uart=args.debug_uart,
+            uart_rt_priority=args.uart_rt_priority,
+            uart_cpu=args.uart_cpu
         )
-        bridge.debug_uart_mode = args.debug_uart
         with bridge:
             if bridge.debug_uart_mode:
-                print("Simple Bridge работает в режиме отладки UART. Нажмите Ctrl+C для остановки.")
+                _LOG.info("Simple Bridge работает в режиме отладки UART. Нажмите Ctrl+C для остановки.")
             elif bridge.udp_transport:
-                print("Simple Bridge работает в режиме моста. Нажмите Ctrl+C для остановки.")
+                _LOG.info("Simple Bridge работает в режиме моста. Нажмите Ctrl+C для остановки.")
             else:
-                print("Simple Bridge работает в режиме монитора UART. Нажмите Ctrl+C для остановки.")
+                _LOG.info("Simple Bridge работает в режиме монитора UART. Нажмите Ctrl+C для остановки.")
             while True:
                 time.sleep(1)
                 
     except KeyboardInterrupt:
-        print("\nПолучен сигнал остановки...")
+        _LOG.info("Получен сигнал остановки...")
     except Exception as e:
-        print(f"Ошибка: {e}")
+        _LOG.error("Ошибка: %s", e)
     finally:
-        print("Simple Bridge завершен")
+        _LOG.info("Simple Bridge завершен")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -7,17 +7,62 @@ Bridge B - Умный мост между UDP и TX модулем
 import time
 import threading
 import argparse
-from typing import Dict, List, Optional
+import logging
+import struct
+import sys
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Optional
 from dual_gpio_uart import DualGPIO_UART
 from udp_transport import BidirectionalUDPTransport
+from io_tuning import DEFAULT_UDP_SOCKET_BUFFER, configure_udp_buffers
 from crsf_protocol import CRSFParser, CRSFFrame, CRSFFrameType, create_heartbeat_frame, create_ping_frame
 
+_LOG = logging.getLogger("bridge_b")
+
+# Предкомпилированные форматы payload телеметрии (big-endian)
+_LINK_STATISTICS = struct.Struct('>BBBbBBBBBb')
+# Емкость (3 байта) и процент заряда читаются одним uint32: старшие 3 байта и младший
+_BATTERY_SENSOR = struct.Struct('>HhI')
+_ATTITUDE = struct.Struct('>hhh')
+
+# Периоды фоновых задач (сек)
+HEARTBEAT_INTERVAL = 10.0
+STATS_INTERVAL = 30.0
+
+class LinkStats(NamedTuple):
+    """Статистика линка связи (LINK_STATISTICS)"""
+    uplink_rssi_1: Optional[int]
+    uplink_rssi_2: Optional[int]
+    uplink_quality: int
+    uplink_snr: int
+    antenna: int
+    rf_mode: int
+    tx_power: int
+    downlink_rssi: Optional[int]
+    downlink_quality: int
+    downlink_snr: int
+
+class Battery(NamedTuple):
+    """Данные батареи (BATTERY_SENSOR)"""
+    voltage: float  # В
+    current: float  # А
+    capacity_used: int  # мАч
+    remaining_percent: int  # %
+
+class Attitude(NamedTuple):
+    """Углы ориентации (ATTITUDE), радианы"""
+    pitch: float
+    roll: float
+    yaw: float
+
 class SmartBridge:
     """Умный мост с парсингом CRSF протокола"""
     
     def __init__(self, uart_port: str, uart_baudrate: int, tx_en_pin: int, rx_en_pin: int,
                  udp_local_port: int, udp_remote_host: str, udp_remote_port: int,
-                 invert_uart: bool = False, gpio_chip: str = "gpiochip0"):
+                 invert_uart: bool = False, gpio_chip: str = "gpiochip0",
+                 parse_udp_ingress: bool = False,
+                 udp_rcvbuf: int = DEFAULT_UDP_SOCKET_BUFFER, udp_sndbuf: int = DEFAULT_UDP_SOCKET_BUFFER):
         
         self.uart = DualGPIO_UART(
             port=uart_port,
@@ -32,296 +77,363 @@ class SmartBridge:
         self.udp_transport = BidirectionalUDPTransport(
             udp_local_port, udp_remote_host, udp_remote_port
         )
+        self.udp_rcvbuf = udp_rcvbuf
+        self.udp_sndbuf = udp_sndbuf
         
-        # CRSF парсеры
+        # CRSF парсеры. Направление UDP -> UART (команды пульта) разбирается только
+        # по запросу: для пересылки разбор не нужен, он дает лишь статистику типов
+        # фреймов и callbacks для них
+        self.parse_udp_ingress = parse_udp_ingress
         self.uart_parser = CRSFParser()
-        self.udp_parser = CRSFParser()
-        
-        # Статистика и состояние
-        self.stats = {
-            'uart_frames_rx': 0,
-            'uart_frames_tx': 0,
-            'udp_frames_rx': 0,
-            'udp_frames_tx': 0,
-            'uart_bytes_rx': 0,
-            'uart_bytes_tx': 0,
-            'udp_bytes_rx': 0,
-            'udp_bytes_tx': 0,
-            'start_time': time.time(),
-            'last_uart_frame': 0,
-            'last_udp_frame': 0,
-            'frame_types_uart_rx': {},
-            'frame_types_udp_rx': {},
-            'parse_errors': 0
-        }
+        self.udp_parser = CRSFParser() if parse_udp_ingress else None
+        
+        # Статистика - обычные атрибуты вместо словаря (обновляются на каждом фрейме)
+        self._uart_frames_rx = 0
+        self._uart_frames_tx = 0
+        self._udp_frames_rx = 0
+        self._udp_frames_tx = 0
+        self._uart_bytes_rx = 0
+        self._uart_bytes_tx = 0
+        self._udp_bytes_rx = 0
+        self._udp_bytes_tx = 0
+        self._start_time = time.time()
+        # Отметки времени фреймов и телеметрии - time.monotonic(); наружу (get_stats,
+        # get_telemetry_data) отдаются в шкале time.time(), как и start_time
+        self._start_mono = time.monotonic()
+        self._last_uart_frame = 0
+        self._last_udp_frame = 0
+        # Последний прием от UDP - обновляется и без разбора (--parse-udp-ingress)
+        self._last_udp_rx = 0
+        self._frame_types_uart_rx = {}
+        self._frame_types_udp_rx = {}
+        self._parse_errors = 0
         
-        # Данные от различных сенсоров (последние полученные)
+        # Данные от различных сенсоров (последние полученные). Отметки обновления
+        # пишутся в _last_update, снаружи доступны только через read-only прокси
+        self._last_update = {}
         self.telemetry_data = {
             'link_stats': None,
             'battery': None,
             'gps': None,
             'attitude': None,
             'flight_mode': None,
-            'last_update': {}
+            'last_update': MappingProxyType(self._last_update)
         }
         
-        # Потоки
-        self.stats_thread = None
-        self.heartbeat_thread = None
+        # Поток периодических задач (heartbeat и статистика)
+        self.scheduler_thread = None
         
         # Callbacks для пользовательской обработки
         self.frame_callbacks = {}
         
     def start(self):
         """Запуск умного моста"""
-        print("Запуск Smart Bridge (Bridge B)...")
+        _LOG.info("Запуск Smart Bridge (Bridge B)...")
         
         # Запуск UART
         self.uart.start()
         
         # Запуск UDP транспорта
-        self.udp_transport.set_data_callback(self._on_udp_data)
+        self.udp_transport.set_data_callback(
+            self._on_udp_data if self.parse_udp_ingress else self._forward_udp_data
+        )
         self.udp_transport.start()
+        configure_udp_buffers(self.udp_transport, self.udp_rcvbuf, self.udp_sndbuf)
         
         # Запуск потоков
-        self.stats_thread = threading.Thread(target=self._stats_loop, daemon=True)
-        self.stats_thread.start()
-        
-        self.heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
-        self.heartbeat_thread.start()
+        self.scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
+        self.scheduler_thread.start()
         
-        print("Smart Bridge запущен")
-        print(f"UART: {self.uart.port} @ {self.uart.baudrate}, TX_EN pin: {self.uart.tx_en_pin}, RX_EN pin: {self.uart.rx_en_pin}")
-        print(f"UDP: {self.udp_transport.transport.local_port} -> {self.udp_transport.transport.remote_host}:{self.udp_transport.transport.remote_port}")
+        _LOG.info("Smart Bridge запущен")
+        _LOG.info("UART: %s @ %d, TX_EN pin: %d, RX_EN pin: %d",
+                  self.uart.port, self.uart.baudrate, self.uart.tx_en_pin, self.uart.rx_en_pin)
+        transport = self.udp_transport.transport
+        _LOG.info("UDP: %s -> %s:%s", transport.local_port, transport.remote_host, transport.remote_port)
         
     def stop(self):
         """Остановка умного моста"""
-        print("Остановка Smart Bridge...")
+        _LOG.info("Остановка Smart Bridge...")
         self.udp_transport.stop()
         self.uart.stop()
-        print("Smart Bridge остановлен")
+        _LOG.info("Smart Bridge остановлен")
         
     def set_frame_callback(self, frame_type: CRSFFrameType, callback):
         """Установка callback для определенного типа фрейма"""
+        if self.udp_parser is None and not self.frame_callbacks:
+            # Предупреждаем один раз: callbacks для телеметрии TX модуля работают и так
+            _LOG.warning("Фреймы от пульта (UDP -> UART) не разбираются без parse_udp_ingress: "
+                         "callbacks сработают только для фреймов от UART (TX модуля)")
         self.frame_callbacks[frame_type] = callback
         
     def _on_uart_data(self, data: bytes):
         """Обработчик данных от UART - парсим и пересылаем в UDP"""
         if len(data) > 0:
-            self.stats['uart_bytes_rx'] += len(data)
+            self._uart_bytes_rx += len(data)
             
-            # Парсим CRSF фреймы
+            # Парсинг нужен только для телеметрии, статистики и callbacks: мост
+            # фреймы не меняет, поэтому пересылаются исходные байты без frame.build()
             frames = self.uart_parser.add_data(data)
             
-            for frame in frames:
-                self._process_uart_frame(frame)
-                
-                # Пересылаем в UDP
-                frame_data = frame.build()
-                success = self.udp_transport.send_crsf_data(frame_data)
-                if success:
-                    self.stats['udp_frames_tx'] += 1
-                    self.stats['udp_bytes_tx'] += len(frame_data)
+            if frames:
+                now = time.monotonic()
+                for frame in frames:
+                    self._process_uart_frame(frame, now)
                     
-            if not frames and len(data) > 0:
-                # Если не удалось распарсить, пересылаем как есть
-                self.udp_transport.send_crsf_data(data)
+            # Пересылаем в UDP одной датаграммой (Bridge A пишет полученные байты
+            # в UART как есть, границы фреймов не важны)
+            success = self.udp_transport.send_crsf_data(data)
+            if success:
+                self._udp_frames_tx += len(frames)
+                self._udp_bytes_tx += len(data)
+                
+    def _forward_udp_data(self, data: bytes):
+        """Обработчик данных от UDP без разбора - сразу пересылаем в UART"""
+        self._udp_bytes_rx += len(data)
+        self._last_udp_rx = time.monotonic()
+        if self.uart.send(data):
+            self._uart_bytes_tx += len(data)
                 
     def _on_udp_data(self, data: bytes):
         """Обработчик данных от UDP - парсим и пересылаем в UART"""
         if len(data) > 0:
-            self.stats['udp_bytes_rx'] += len(data)
+            self._udp_bytes_rx += len(data)
+            now = time.monotonic()
+            self._last_udp_rx = now
             
-            # Парсим CRSF фреймы
+            # Парсим CRSF фреймы (статистика и callbacks), пересылаем исходные байты
             frames = self.udp_parser.add_data(data)
             
-            for frame in frames:
-                self._process_udp_frame(frame)
-                
-                # Пересылаем в UART
-                frame_data = frame.build()
-                success = self.uart.send(frame_data)
-                if success:
-                    self.stats['uart_frames_tx'] += 1
-                    self.stats['uart_bytes_tx'] += len(frame_data)
+            if frames:
+                for frame in frames:
+                    self._process_udp_frame(frame, now)
                     
-            if not frames and len(data) > 0:
-                # Если не удалось распарсить, пересылаем как есть
-                self.uart.send(data)
+            # Пересылаем в UART одной записью (одно переключение направления)
+            success = self.uart.send(data)
+            if success:
+                self._uart_frames_tx += len(frames)
+                self._uart_bytes_tx += len(data)
                 
-    def _process_uart_frame(self, frame: CRSFFrame):
+    def _process_uart_frame(self, frame: CRSFFrame, now: float):
         """Обработка фрейма от UART (телеметрия от TX модуля)"""
-        self.stats['uart_frames_rx'] += 1
-        self.stats['last_uart_frame'] = time.time()
+        self._uart_frames_rx += 1
+        self._last_uart_frame = now
         
         # Статистика по типам фреймов
         frame_type = frame.frame_type
-        if frame_type not in self.stats['frame_types_uart_rx']:
-            self.stats['frame_types_uart_rx'][frame_type] = 0
-        self.stats['frame_types_uart_rx'][frame_type] += 1
+        counts = self._frame_types_uart_rx
+        counts[frame_type] = counts.get(frame_type, 0) + 1
         
         # Извлечение данных телеметрии
-        self._extract_telemetry_data(frame)
+        self._extract_telemetry_data(frame, now)
         
         # Пользовательские callbacks
         if frame_type in self.frame_callbacks:
             try:
                 self.frame_callbacks[frame_type](frame)
-            except Exception as e:
-                print(f"Ошибка в callback для фрейма {frame_type:02X}: {e}")
+            except Exception:
+                _LOG.exception("Ошибка в callback для фрейма %02X", frame_type)
                 
-        # Логирование для отладки
-        print(f"UART->UDP: {frame}")
+        # Логирование для отладки (str(frame) вычисляется только при уровне DEBUG)
+        _LOG.debug("UART->UDP: %s", frame)
         
-    def _process_udp_frame(self, frame: CRSFFrame):
+    def _process_udp_frame(self, frame: CRSFFrame, now: float):
         """Обработка фрейма от UDP (команды от пульта)"""
-        self.stats['udp_frames_rx'] += 1
-        self.stats['last_udp_frame'] = time.time()
+        self._udp_frames_rx += 1
+        self._last_udp_frame = now
         
         # Статистика по типам фреймов
         frame_type = frame.frame_type
-        if frame_type not in self.stats['frame_types_udp_rx']:
-            self.stats['frame_types_udp_rx'][frame_type] = 0
-        self.stats['frame_types_udp_rx'][frame_type] += 1
+        counts = self._frame_types_udp_rx
+        counts[frame_type] = counts.get(frame_type, 0) + 1
         
         # Пользовательские callbacks
         if frame_type in self.frame_callbacks:
             try:
                 self.frame_callbacks[frame_type](frame)
-            except Exception as e:
-                print(f"Ошибка в callback для фрейма {frame_type:02X}: {e}")
+            except Exception:
+                _LOG.exception("Ошибка в callback для фрейма %02X", frame_type)
                 
-        # Логирование для отладки
-        print(f"UDP->UART: {frame}")
+        # Логирование для отладки (str(frame) вычисляется только при уровне DEBUG)
+        _LOG.debug("UDP->UART: %s", frame)
         
-    def _extract_telemetry_data(self, frame: CRSFFrame):
+    def _extract_telemetry_data(self, frame: CRSFFrame, now: float):
         """Извлечение данных телеметрии из фрейма"""
         frame_type = frame.frame_type
-        current_time = time.time()
+        entry = self._EXTRACTORS.get(frame_type)
+        if entry is None:
+            return
+        extractor, min_length = entry
+        payload = frame.payload
+        if len(payload) < min_length:
+            return
         
         try:
-            if frame_type == CRSFFrameType.LINK_STATISTICS and len(frame.payload) >= 10:
-                # Статистика линка связи
-                payload = frame.payload
-                self.telemetry_data['link_stats'] = {
-                    'uplink_rssi_1': -payload[0] if payload[0] > 0 else None,
-                    'uplink_rssi_2': -payload[1] if payload[1] > 0 else None,
-                    'uplink_quality': payload[2],
-                    'uplink_snr': payload[3] if payload[3] < 128 else payload[3] - 256,
-                    'antenna': payload[4],
-                    'rf_mode': payload[5],
-                    'tx_power': payload[6],
-                    'downlink_rssi': -payload[7] if payload[7] > 0 else None,
-                    'downlink_quality': payload[8],
-                    'downlink_snr': payload[9] if payload[9] < 128 else payload[9] - 256,
-                }
-                self.telemetry_data['last_update']['link_stats'] = current_time
-                
-            elif frame_type == CRSFFrameType.BATTERY_SENSOR and len(frame.payload) >= 8:
-                # Данные батареи
-                payload = frame.payload
-                voltage = int.from_bytes(payload[0:2], byteorder='big') / 100.0  # В вольтах
-                current = int.from_bytes(payload[2:4], byteorder='big', signed=True) / 100.0  # В амперах
-                capacity = int.from_bytes(payload[4:7], byteorder='big')  # мАч
-                remaining = payload[7]  # проценты
-                
-                self.telemetry_data['battery'] = {
-                    'voltage': voltage,
-                    'current': current,
-                    'capacity_used': capacity,
-                    'remaining_percent': remaining
-                }
-                self.telemetry_data['last_update']['battery'] = current_time
-                
-            elif frame_type == CRSFFrameType.ATTITUDE and len(frame.payload) >= 6:
-                # Данные ориентации
-                payload = frame.payload
-                pitch = int.from_bytes(payload[0:2], byteorder='big', signed=True) / 10000.0
-                roll = int.from_bytes(payload[2:4], byteorder='big', signed=True) / 10000.0
-                yaw = int.from_bytes(payload[4:6], byteorder='big', signed=True) / 10000.0
-                
-                self.telemetry_data['attitude'] = {
-                    'pitch': pitch,
-                    'roll': roll,
-                    'yaw': yaw
-                }
-                self.telemetry_data['last_update']['attitude'] = current_time
-                
-            elif frame_type == CRSFFrameType.FLIGHT_MODE:
-                # Режим полета
-                try:
-                    flight_mode = frame.payload.decode('utf-8').rstrip('\x00')
-                    self.telemetry_data['flight_mode'] = flight_mode
-                    self.telemetry_data['last_update']['flight_mode'] = current_time
-                except:
-                    pass
-                    
-        except Exception as e:
-            print(f"Ошибка извлечения телеметрии из фрейма {frame_type:02X}: {e}")
+            extractor(self, payload, now)
+        except Exception:
+            _LOG.exception("Ошибка извлечения телеметрии из фрейма %02X", frame_type)
+            
+    def _extract_link_stats(self, payload: bytes, now: float):
+        """Статистика линка связи"""
+        (rssi_1, rssi_2, uplink_quality, uplink_snr, antenna, rf_mode, tx_power,
+         downlink_rssi, downlink_quality, downlink_snr) = _LINK_STATISTICS.unpack_from(payload)
+        # RSSI передается как положительное число дБм со знаком минус, 0 - нет данных (None);
+        # SNR уже знаковые (формат 'b')
+        self.telemetry_data['link_stats'] = LinkStats(
+            -rssi_1 or None, -rssi_2 or None, uplink_quality, uplink_snr,
+            antenna, rf_mode, tx_power,
+            -downlink_rssi or None, downlink_quality, downlink_snr
+        )
+        self._last_update['link_stats'] = now
+        
+    def _extract_battery(self, payload: bytes, now: float):
+        """Данные батареи"""
+        voltage, current, capacity_remaining = _BATTERY_SENSOR.unpack_from(payload)
+        
+        self.telemetry_data['battery'] = Battery(
+            voltage / 100.0, current / 100.0, capacity_remaining >> 8, capacity_remaining & 0xFF
+        )
+        self._last_update['battery'] = now
+        
+    def _extract_attitude(self, payload: bytes, now: float):
+        """Данные ориентации"""
+        pitch, roll, yaw = _ATTITUDE.unpack_from(payload)
+        
+        self.telemetry_data['attitude'] = Attitude(pitch / 10000.0, roll / 10000.0, yaw / 10000.0)
+        self._last_update['attitude'] = now
+        
+    def _extract_flight_mode(self, payload: bytes, now: float):
+        """Режим полета"""
+        try:
+            flight_mode = payload.decode('utf-8').rstrip('\x00')
+        except UnicodeDecodeError:
+            return
+        self.telemetry_data['flight_mode'] = flight_mode
+        self._last_update['flight_mode'] = now
+        
+    # Тип фрейма -> (извлекатель, минимальная длина payload)
+    _EXTRACTORS = {
+        CRSFFrameType.LINK_STATISTICS: (_extract_link_stats, 10),
+        CRSFFrameType.BATTERY_SENSOR: (_extract_battery, 8),
+        CRSFFrameType.ATTITUDE: (_extract_attitude, 6),
+        CRSFFrameType.FLIGHT_MODE: (_extract_flight_mode, 0),
+    }
             
     def get_telemetry_data(self) -> dict:
-        """Возвращает последние данные телеметрии"""
-        return self.telemetry_data.copy()
+        """Возвращает последние данные телеметрии (сенсоры в виде словарей)"""
+        telemetry = {}
+        for data_type, data in self.telemetry_data.items():
+            if isinstance(data, tuple):
+                data = data._asdict()
+            elif data_type == 'last_update':
+                data = {key: self._to_wall_time(ts) for key, ts in data.items()}
+            telemetry[data_type] = data
+        return telemetry
         
+    def get_telemetry_view(self) -> MappingProxyType:
+        """Возвращает живое read-only представление телеметрии без копирования.
+
+        Сенсоры представлены NamedTuple (LinkStats, Battery, Attitude) и заменяются
+        целиком при каждом обновлении, поэтому полученный объект не меняется под
+        читателем. Подходит для частого опроса.
+
+        Исключение - view['last_update']: это тоже read-only прокси, но живой -
+        отметки (time.monotonic()) в нем обновляются по мере прихода телеметрии.
+        Для снимка в шкале time.time() используйте get_telemetry_data().
+        """
+        return MappingProxyType(self.telemetry_data)
+        
+    def _to_wall_time(self, mono: float) -> float:
+        """Перевод отметки time.monotonic() во время time.time() (0 - событий не было)"""
+        return self._start_time + (mono - self._start_mono) if mono else 0
+
     def get_stats(self) -> dict:
-        """Возвращает статистику моста"""
-        return self.stats.copy()
+        """Возвращает статистику моста (отметки времени - по time.time())"""
+        return {
+            'uart_frames_rx': self._uart_frames_rx,
+            'uart_frames_tx': self._uart_frames_tx,
+            'udp_frames_rx': self._udp_frames_rx,
+            'udp_frames_tx': self._udp_frames_tx,
+            'uart_bytes_rx': self._uart_bytes_rx,
+            'uart_bytes_tx': self._uart_bytes_tx,
+            'udp_bytes_rx': self._udp_bytes_rx,
+            'udp_bytes_tx': self._udp_bytes_tx,
+            'start_time': self._start_time,
+            'last_uart_frame': self._to_wall_time(self._last_uart_frame),
+            'last_udp_frame': self._to_wall_time(self._last_udp_frame),
+            'last_udp_rx': self._to_wall_time(self._last_udp_rx),
+            'frame_types_uart_rx': dict(self._frame_types_uart_rx),
+            'frame_types_udp_rx': dict(self._frame_types_udp_rx),
+            'parse_errors': self._parse_errors
+        }
         
-    def _heartbeat_loop(self):
-        """Цикл отправки heartbeat пакетов в TX модуль"""
-        while self.uart.is_running:
-            # Отправляем heartbeat каждые 10 секунд
-            heartbeat = create_heartbeat_frame()
-            heartbeat_data = heartbeat.build()
-            self.uart.send(heartbeat_data)
+    def _send_heartbeat(self):
+        """Отправка heartbeat пакета в TX модуль"""
+        heartbeat = create_heartbeat_frame()
+        self.uart.send(heartbeat.build())
             
-            time.sleep(10.0)
-            
-    def _stats_loop(self):
-        """Цикл вывода статистики"""
+    def _scheduler_loop(self):
+        """Единый цикл периодических задач: heartbeat и вывод статистики"""
+        now = time.monotonic()
+        next_heartbeat = now  # первый heartbeat сразу после запуска
+        next_stats = now + STATS_INTERVAL
         while self.uart.is_running:
-            time.sleep(30)  # Статистика каждые 30 секунд
-            self._print_stats()
+            now = time.monotonic()
+            if now >= next_heartbeat:
+                self._send_heartbeat()
+                next_heartbeat += HEARTBEAT_INTERVAL
+            if now >= next_stats:
+                self._print_stats()
+                next_stats += STATS_INTERVAL
+            time.sleep(max(0.0, min(next_heartbeat, next_stats) - time.monotonic()))
             
     def _print_stats(self):
         """Вывод подробной статистики"""
-        uptime = time.time() - self.stats['start_time']
-        uart_frame_ago = time.time() - self.stats['last_uart_frame'] if self.stats['last_uart_frame'] > 0 else uptime
-        udp_frame_ago = time.time() - self.stats['last_udp_frame'] if self.stats['last_udp_frame'] > 0 else uptime
+        stats = self.get_stats()
+        now = time.monotonic()
+        uptime = now - self._start_mono
+        uart_frame_ago = now - self._last_uart_frame if self._last_uart_frame > 0 else uptime
+        udp_rx_ago = now - self._last_udp_rx if self._last_udp_rx > 0 else uptime
         
         udp_stats = self.udp_transport.get_stats()
         
-        print("\n" + "="*70)
-        print("SMART BRIDGE СТАТИСТИКА")
-        print("="*70)
-        print(f"Время работы: {uptime:.1f} сек")
-        print(f"UART RX: {self.stats['uart_frames_rx']} фреймов, {self.stats['uart_bytes_rx']} байт")
-        print(f"UART TX: {self.stats['uart_frames_tx']} фреймов, {self.stats['uart_bytes_tx']} байт")
-        print(f"UDP RX:  {self.stats['udp_frames_rx']} фреймов, {self.stats['udp_bytes_rx']} байт")
-        print(f"UDP TX:  {self.stats['udp_frames_tx']} фреймов, {self.stats['udp_bytes_tx']} байт")
-        print(f"Последний UART фрейм: {uart_frame_ago:.1f} сек назад")
-        print(f"Последний UDP фрейм: {udp_frame_ago:.1f} сек назад")
-        print(f"UDP соединение: {'активно' if udp_stats['connection_active'] else 'неактивно'}")
+        # Весь отчет - одна запись лога, чтобы не перемешивался с другими сообщениями
+        lines = ["", "="*70]
+        lines.append("SMART BRIDGE СТАТИСТИКА")
+        lines.append("="*70)
+        lines.append(f"Время работы: {uptime:.1f} сек")
+        lines.append(f"UART RX: {stats['uart_frames_rx']} фреймов, {stats['uart_bytes_rx']} байт")
+        if self.udp_parser is not None:
+            lines.append(f"UART TX: {stats['uart_frames_tx']} фреймов, {stats['uart_bytes_tx']} байт")
+            lines.append(f"UDP RX:  {stats['udp_frames_rx']} фреймов, {stats['udp_bytes_rx']} байт")
+        else:
+            # Без --parse-udp-ingress фреймы направления UDP -> UART не считаются
+            lines.append(f"UART TX: {stats['uart_bytes_tx']} байт (без разбора)")
+            lines.append(f"UDP RX:  {stats['udp_bytes_rx']} байт (без разбора)")
+        lines.append(f"UDP TX:  {stats['udp_frames_tx']} фреймов, {stats['udp_bytes_tx']} байт")
+        lines.append(f"Последний UART фрейм: {uart_frame_ago:.1f} сек назад")
+        lines.append(f"Последний прием UDP: {udp_rx_ago:.1f} сек назад")
+        lines.append(f"UDP соединение: {'активно' if udp_stats['connection_active'] else 'неактивно'}")
         
         # Типы фреймов
-        if self.stats['frame_types_uart_rx']:
-            print("\nТипы фреймов UART RX:")
-            for frame_type, count in self.stats['frame_types_uart_rx'].items():
-                print(f"  0x{frame_type:02X}: {count}")
+        if stats['frame_types_uart_rx']:
+            lines.append("\nТипы фреймов UART RX:")
+            for frame_type, count in stats['frame_types_uart_rx'].items():
+                lines.append(f"  0x{frame_type:02X}: {count}")
                 
-        if self.stats['frame_types_udp_rx']:
-            print("\nТипы фреймов UDP RX:")
-            for frame_type, count in self.stats['frame_types_udp_rx'].items():
-                print(f"  0x{frame_type:02X}: {count}")
+        if stats['frame_types_udp_rx']:
+            lines.append("\nТипы фреймов UDP RX:")
+            for frame_type, count in stats['frame_types_udp_rx'].items():
+                lines.append(f"  0x{frame_type:02X}: {count}")
                 
         # Телеметрия
-        print("\nПоследняя телеметрия:")
+        lines.append("\nПоследняя телеметрия:")
         for data_type, data in self.telemetry_data.items():
             if data_type != 'last_update' and data is not None:
-                age = time.time() - self.telemetry_data['last_update'].get(data_type, 0)
-                print(f"  {data_type}: {data} ({age:.1f}s)")
+                age = now - self._last_update.get(data_type, 0)
+                lines.append(f"  {data_type}: {data} ({age:.1f}s)")
                 
-        print("="*70)
+        lines.append("="*70)
+        _LOG.info("\n".join(lines))
 
     def __enter__(self):
         self.start()
@@ -348,15 +460,25 @@ def main():
     
     # Добавляем новый аргумент
     parser.add_argument('--invert-uart', action='store_true', help='Инвертировать UART сигнал (программно)')
+    parser.add_argument('--parse-udp-ingress', action='store_true',
+                       help='Разбирать CRSF фреймы от пульта (UDP -> UART) для статистики и callbacks')
+    parser.add_argument('--verbose', action='store_true', help='Подробный лог каждого фрейма (уровень DEBUG)')
     
     # UDP параметры
     parser.add_argument('--udp-local-port', type=int, required=True, help='Локальный UDP порт')
     parser.add_argument('--udp-remote-host', type=str, required=True, help='IP адрес удаленного моста')
     parser.add_argument('--udp-remote-port', type=int, default=5000,
                        help='UDP порт удаленного моста (по умолчанию: 5000)')
+    parser.add_argument('--udp-rcvbuf', type=int, default=DEFAULT_UDP_SOCKET_BUFFER,
+                       help='Размер SO_RCVBUF UDP сокета в байтах (по умолчанию: 4 МБ)')
+    parser.add_argument('--udp-sndbuf', type=int, default=DEFAULT_UDP_SOCKET_BUFFER,
+                       help='Размер SO_SNDBUF UDP сокета в байтах (по умолчанию: 4 МБ)')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+    
     # Создание и запуск моста
     bridge = SmartBridge(
         uart_port=args.uart_port,
@@ -367,33 +489,38 @@ def main():
         udp_remote_host=args.udp_remote_host,
         udp_remote_port=args.udp_remote_port,
         invert_uart=args.invert_uart,
-        gpio_chip=args.gpio_chip
+        gpio_chip=args.gpio_chip,
+        parse_udp_ingress=args.parse_udp_ingress,
+        udp_rcvbuf=args.udp_rcvbuf,
+        udp_sndbuf=args.udp_sndbuf
     )
     
-    # Пример установки callback для фрейма RC каналов
+    # Пример установки callback для фрейма RC каналов (RC каналы приходят от пульта
+    # по UDP, поэтому callback имеет смысл только с --parse-udp-ingress)
     def on_rc_channels(frame):
         if len(frame.payload) == 22:  # RC_CHANNELS_PACKED
-            print("Получены RC каналы от пульта")
+            _LOG.info("Получены RC каналы от пульта")
             
-    bridge.set_frame_callback(CRSFFrameType.RC_CHANNELS_PACKED, on_rc_channels)
+    if args.parse_udp_ingress:
+        bridge.set_frame_callback(CRSFFrameType.RC_CHANNELS_PACKED, on_rc_channels)
     
     try:
         with bridge:
-            print("Smart Bridge работает. Нажмите Ctrl+C для остановки.")
+            _LOG.info("Smart Bridge работает. Нажмите Ctrl+C для остановки.")
             while True:
                 time.sleep(1)
                 
                 # Пример получения телеметрии
                 # telemetry = bridge.get_telemetry_data()
                 # if telemetry['link_stats']:
-                #     print(f"Link Quality: {telemetry['link_stats']['uplink_quality']}%")
+                #     _LOG.info("Link Quality: %d%%", telemetry['link_stats']['uplink_quality'])
                 
     except KeyboardInterrupt:
-        print("\nПолучен сигнал остановки...")
+        _LOG.info("Получен сигнал остановки...")
     except Exception as e:
-        print(f"Ошибка: {e}")
+        _LOG.error("Ошибка: %s", e)
     finally:
-        print("Smart Bridge завершен")
+        _LOG.info("Smart Bridge завершен")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,13 +1,21 @@
 #!/usr/bin/env python3
+import os
+import re
+import selectors
 import serial
-import time
+from io_tuning import enable_low_latency
 
 BAUDRATE = 400000
 SERIAL_PORT = '/dev/serial0'
 RC_CHANNELS_TYPE = 0x16
+READ_SIZE = 4096          # Максимум байт за одно чтение из порта
+SELECT_TIMEOUT = 0.5      # Период пробуждения без данных (сек)
+SYNC_BYTES = (0xC8, 0xEE, 0xEA)  # SYNC или адреса устройств
+# Один проход по буферу вместо отдельного find на каждый sync byte
+_SYNC_RE = re.compile(b'[' + re.escape(bytes(SYNC_BYTES)) + b']')
 
 # CRC8 lookup table для CRSF (полином 0xD5)
-crc8_table = [
+crc8_table = bytes([
     0x00, 0xD5, 0x7F, 0xAA, 0xFE, 0x2B, 0x81, 0x54, 0x29, 0xFC, 0x56, 0x83, 0xD7, 0x02, 0xA8, 0x7D,
     0x52, 0x87, 0x2D, 0xF8, 0xAC, 0x79, 0xD3, 0x06, 0x7B, 0xAE, 0x04, 0xD1, 0x85, 0x50, 0xFA, 0x2F,
     0xA4, 0x71, 0xDB, 0x0E, 0x5A, 0x8F, 0x25, 0xF0, 0x8D, 0x58, 0xF2, 0x27, 0x73, 0xA6, 0x0C, 0xD9,
@@ -24,54 +32,42 @@ crc8_table = [
     0x20, 0xF5, 0x5F, 0x8A, 0xDE, 0x0B, 0xA1, 0x74, 0x09, 0xDC, 0x76, 0xA3, 0xF7, 0x22, 0x88, 0x5D,
     0xD6, 0x03, 0xA9, 0x7C, 0x28, 0xFD, 0x57, 0x82, 0xFF, 0x2A, 0x80, 0x55, 0x01, 0xD4, 0x7E, 0xAB,
     0x84, 0x51, 0xFB, 0x2E, 0x7A, 0xAF, 0x05, 0xD0, 0xAD, 0x78, 0xD2, 0x07, 0x53, 0x86, 0x2C, 0xF9
-]
+])
 
 def crc8(data):
     """Вычисляет CRC8 для CRSF данных"""
+    table = crc8_table  # локальная ссылка вместо поиска глобального имени на каждом байте
     crc = 0
     for byte in data:
-        crc = crc8_table[crc ^ byte]
+        crc = table[crc ^ byte]
     return crc
 
-def ticks_to_us(ticks):
-    """Конвертирует CRSF ticks в микросекунды"""
-    return (ticks - 992) * 5 // 8 + 1500
+# Битовые смещения 16 каналов по 11 бит в упакованном payload
+CHANNEL_SHIFTS = tuple(range(0, 16 * 11, 11))
 
 def unpack_channels(payload):
     """Распаковывает 22 байта в 16 каналов по 11 бит каждый"""
     if len(payload) != 22:
         return None
     
-    # Конвертируем байты в бинарную строку (little-endian)
-    bit_string = ''.join(f'{byte:08b}'[::-1] for byte in payload)
-    
-    channels = []
-    for i in range(16):
-        # Извлекаем 11 бит для каждого канала
-        start = i * 11
-        end = start + 11
-        channel_bits = bit_string[start:end][::-1]  # Реверсируем биты
-        ticks = int(channel_bits, 2)
-        channels.append(ticks_to_us(ticks))
-    
-    return channels
+    # Весь payload как одно little-endian число, каналы - 11-битные поля подряд;
+    # перевод CRSF ticks в микросекунды: (ticks - 992) * 5 // 8 + 1500
+    packed = int.from_bytes(payload, 'little')
+    return [(((packed >> shift) & 0x7FF) - 992) * 5 // 8 + 1500 for shift in CHANNEL_SHIFTS]
 
 def parse_crsf_frame(buffer):
     """Парсит CRSF фрейм из буфера"""
     while len(buffer) >= 4:
         # Ищем начало фрейма (sync byte)
-        sync_found = False
-        for i in range(len(buffer)):
-            if buffer[i] in [0xC8, 0xEE, 0xEA]:  # SYNC или адреса устройств
-                if i > 0:
-                    buffer[:i] = []  # Удаляем мусор
-                sync_found = True
-                break
-        
-        if not sync_found:
+        m = _SYNC_RE.search(buffer)
+        if m is None:
             buffer.clear()
             return None
         
+        i = m.start()
+        if i:
+            del buffer[:i]  # Удаляем мусор
+        
         if len(buffer) < 2:
             return None
             
@@ -86,7 +82,7 @@ def parse_crsf_frame(buffer):
         
         # Извлекаем фрейм
         frame = bytes(buffer[:total_length])
-        buffer[:total_length] = []
+        del buffer[:total_length]
         
         # Проверяем CRC
         calculated_crc = crc8(frame[2:-1])
@@ -105,15 +101,36 @@ def main():
         with serial.Serial(SERIAL_PORT, BAUDRATE, timeout=0.1) as ser:
             buffer = bytearray()
             
+            enable_low_latency(ser)
+            
+            # Читаем напрямую из fd порта: ожидание данных в epoll и один os.read
+            # на всю накопившуюся пачку вместо read(1) + read(in_waiting) через pyserial
+            fd = ser.fileno()
+            os.set_blocking(fd, False)
+            sel = selectors.DefaultSelector()
+            sel.register(fd, selectors.EVENT_READ)
+            
             while True:
-                # Читаем данные
-                if ser.in_waiting > 0:
-                    data = ser.read(ser.in_waiting)
-                    buffer.extend(data)
+                if not sel.select(SELECT_TIMEOUT):
+                    continue
+                try:
+                    data = os.read(fd, READ_SIZE)
+                except BlockingIOError:
+                    continue
+                if not data:
+                    # fd готов к чтению, но данных нет - порт отключен (EOF)
+                    raise serial.SerialException('device reports readiness to read but returned no data '
+                                                 '(device disconnected?)')
+                buffer.extend(data)
                 
-                # Парсим фреймы
-                frame = parse_crsf_frame(buffer)
-                if frame and frame[2] == RC_CHANNELS_TYPE:
+                # Парсим все накопившиеся фреймы
+                while True:
+                    frame = parse_crsf_frame(buffer)
+                    if frame is None:
+                        break
+                    if frame[2] != RC_CHANNELS_TYPE:
+                        continue
+                    
                     payload = frame[3:-1]
                     channels = unpack_channels(payload)
                     
@@ -123,8 +140,6 @@ def main():
                               f"CH9-CH16: {channels[8]:4d} {channels[9]:4d} {channels[10]:4d} {channels[11]:4d} "
                               f"{channels[12]:4d} {channels[13]:4d} {channels[14]:4d} {channels[15]:4d}")
                 
-                time.sleep(0.001)
-                
     except KeyboardInterrupt:
         print("\nЗавершение работы...")
     except Exception as e:
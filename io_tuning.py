@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Общая настройка портов для мостов и утилит: буферы UDP сокета транспорта
+и режим low latency для UART
+"""
+
+import logging
+import socket
+import sys
+
+_LOG = logging.getLogger("io_tuning")
+
+# Размер буферов UDP сокета по умолчанию (4 МБ) - защита от потерь при всплесках и паузах GC
+DEFAULT_UDP_SOCKET_BUFFER = 4 * 1024 * 1024
+
+def configure_udp_buffers(udp_transport, rcvbuf: int, sndbuf: int) -> None:
+    """Увеличение SO_RCVBUF/SO_SNDBUF сокета BidirectionalUDPTransport"""
+    # Имя атрибута сокета у транспорта не зафиксировано API, проверяем оба варианта
+    transport = getattr(udp_transport, 'transport', None)
+    sock = getattr(transport, 'socket', None) or getattr(transport, 'sock', None)
+    if sock is None:
+        _LOG.warning("UDP сокет транспорта недоступен, размеры буферов не изменены")
+        return
+    for name, option, size in (('SO_RCVBUF', socket.SO_RCVBUF, rcvbuf),
+                               ('SO_SNDBUF', socket.SO_SNDBUF, sndbuf)):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, size)
+            actual = sock.getsockopt(socket.SOL_SOCKET, option)
+        except OSError as e:
+            _LOG.warning("Не удалось установить %s: %s", name, e)
+            continue
+        # Linux удваивает значение (запас на служебные данные ядра) и ограничивает
+        # его net.core.rmem_max/wmem_max, поэтому без ограничения читается 2 * size
+        expected = 2 * size if sys.platform.startswith('linux') else size
+        if actual < expected:
+            _LOG.warning("%s ограничен ядром: %d байт вместо %d (увеличьте net.core.rmem_max/wmem_max)",
+                         name, actual, expected)
+
+def enable_low_latency(ser) -> bool:
+    """Включение ASYNC_LOW_LATENCY для порта (у USB-UART адаптеров убирает накопление ~16 мс)"""
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, OSError, ValueError) as e:
+        _LOG.debug("Режим low latency для UART недоступен: %s", e)
+        return False
+    return True
@@ -20,7 +20,11 @@ INTER_BYTE_TIMEOUT = None            # Межсимвольный таймаут
 EXCLUSIVE = None                     # Эксклюзивный доступ (только для POSIX)
 
 DUMP_DURATION = 1                    # Длительность сбора данных в секундах
-OUTPUT_FILE = 'uart_dump.txt'        # Файл для сохранения данных
+OUTPUT_FILE = 'uart_dump.txt'        # Файл для сохранения данных (HEX текст)
+RAW_OUTPUT = False                   # True - писать сырые байты без HEX форматирования
+RAW_OUTPUT_FILE = 'uart_dump.bin'    # Файл для сырых байт (HEX offline: xxd uart_dump.bin)
+READ_SIZE = 4096                     # Максимум байт за одно чтение из порта
+FILE_BUFFER_SIZE = 1 << 20           # Буфер записи в файл (байт) - на диск крупными блоками
 
 def main():
     """
@@ -28,6 +32,7 @@ def main():
     """
     ser = None
     dump_file = None
+    output_file = RAW_OUTPUT_FILE if RAW_OUTPUT else OUTPUT_FILE
     
     try:
         # Открываем serial порт
@@ -48,9 +53,15 @@ def main():
         )
         print(f"Порт {ser.port} успешно открыт.")
         
+        # ASYNC_LOW_LATENCY: USB-UART адаптеры иначе копят данные до ~16 мс
+        try:
+            ser.set_low_latency_mode(True)
+        except (AttributeError, OSError, ValueError) as e:
+            print(f"Режим low latency недоступен: {e}")
+        
         # Открываем файл для записи
-        print(f"Данные будут сохранены в файл: {OUTPUT_FILE}")
-        dump_file = open(OUTPUT_FILE, 'w')
+        print(f"Данные будут сохранены в файл: {output_file}")
+        dump_file = open(output_file, 'wb', buffering=FILE_BUFFER_SIZE)
         
         print(f"Начинаю сбор данных в течение {DUMP_DURATION} секунд...")
         
@@ -59,20 +70,26 @@ def main():
         # Цикл сбора данных
         # Используем блокирующее чтение с таймаутом для эффективности.
         # Это позволяет не нагружать CPU постоянными проверками.
-        end_time = time.time() + DUMP_DURATION
-        while time.time() < end_time:
-            # Динамически уменьшаем таймаут, чтобы общее время не превысило DUMP_DURATION
-            ser.timeout = max(0, end_time - time.time())
-            
-            # Читаем доступные данные (до 1024 байт за раз)
-            data_bytes = ser.read(1024)
+        # Таймаут порта (TIMEOUT) задан один раз при открытии: его смена в цикле - это
+        # лишний tcsetattr на каждое чтение, а сбор завершится не позже чем через TIMEOUT
+        # после DUMP_DURATION
+        end_time = time.monotonic() + DUMP_DURATION
+        while time.monotonic() < end_time:
+            # Читаем доступные данные (до READ_SIZE байт за раз)
+            data_bytes = ser.read(READ_SIZE)
             
             if data_bytes:
                 total_bytes_read += len(data_bytes)
                 
-                # Конвертируем в HEX и записываем в файл
-                hex_string = ' '.join(f'{b:02X}' for b in data_bytes)
-                dump_file.write(hex_string + ' ') # Добавляем пробел, чтобы данные не слипались
+                if RAW_OUTPUT:
+                    # Сырые байты как есть - без форматирования и втрое меньше объем
+                    dump_file.write(data_bytes)
+                    continue
+                
+                # Конвертируем в HEX (bytes.hex выполняется в C) и записываем в файл
+                hex_string = data_bytes.hex(' ').upper()
+                dump_file.write(hex_string.encode('ascii'))
+                dump_file.write(b' ') # Добавляем пробел, чтобы данные не слипались
                 
         print("\nСбор данных завершен.")
         print(f"Всего записано байт: {total_bytes_read}")
@@ -89,7 +106,7 @@ def main():
             print("Порт закрыт.")
         if dump_file:
             dump_file.close()
-            print(f"Файл {OUTPUT_FILE} сохранен.")
+            print(f"Файл {output_file} сохранен.")
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
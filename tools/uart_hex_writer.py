@@ -3,6 +3,7 @@ import time
 
 PORT = '/dev/serial0'
 BAUDRATE = 115200
+SEND_INTERVAL = 0.5  # Период отправки байта (сек)
 
 def invert_byte(byte_val):
     """Инвертировать байт (XOR с 0xFF)"""
@@ -11,12 +12,17 @@ def invert_byte(byte_val):
 try:
     with serial.Serial(PORT, BAUDRATE, timeout=1) as ser:
         print(f"Открыт порт {PORT} на скорости {BAUDRATE}")
+        byte_to_send = b'\x55'
+        # Отправка по абсолютным моментам времени: задержки write/print не накапливаются
+        next_time = time.monotonic()
         while True:
             for i in range(1, 17):  # от 1 до 16
-                byte_to_send = (0x55).to_bytes(1, 'big')
                 ser.write(byte_to_send)
                 print(f"Отправлено: {byte_to_send.hex()}")
-                time.sleep(0.5)
+                next_time += SEND_INTERVAL
+                delay = next_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
 
 except KeyboardInterrupt:
     print("\nПрограмма завершена пользователем.")